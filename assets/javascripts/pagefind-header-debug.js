@@ -30,6 +30,18 @@
     });
   }
 
+  // Each spec version has its own Pagefind shard (pagefind/<version>/), the
+  // rest of the site lives in the root shard (pagefind/). A spec page only
+  // searches its own version; other pages search the site plus the latest
+  // version.
+  function searchScope() {
+    const versions = window.__SPEC_VERSIONS__ || [];
+    const m = location.pathname.match(/\/swhid-specification\/(v\d+\.\d+(?:\.\d+)?|dev)(?:\/|$)/);
+    if (m) return { version: m[1], shards: [`${m[1]}/`] };
+    const latest = versions[0];
+    return { version: null, shards: latest ? ["", `${latest}/`] : [""] };
+  }
+
   function ready(fn) {
     if (document.readyState === "loading") {
       console.log("🔍 Pagefind Header Debug: Waiting for DOMContentLoaded");
@@ -79,17 +91,24 @@
 
     // Initialize Pagefind UI directly in the header.
     // It will render its own input + live results dropdown.
+    const scope = searchScope();
+    if (scope.version) host.dataset.pfScope = scope.version;
+    console.log("🔍 Pagefind Header Debug: Search shards:", scope.shards.map((shard) => `/pagefind/${shard}`));
+
     console.log("🔍 Pagefind Header Debug: Initializing PagefindUI...");
     try {
       /* global PagefindUI */
       new PagefindUI({
         element: "#pf-header-ui",
-        bundlePath: "/pagefind/",
+        bundlePath: `/pagefind/${scope.shards[0]}`,
+        mergeIndex: scope.shards.slice(1).map((shard) => ({ bundlePath: `/pagefind/${shard}` })),
         baseUrl: "/",
         showSubResults: true,
         showImages: false,
         showFilters: ["section", "spec_version", "tag"],
-        translations: { placeholder: "Search SWHID.org" },
+        translations: {
+          placeholder: scope.version ? `Search SWHID ${scope.version}` : "Search SWHID.org",
+        },
       });
       console.log("🔍 Pagefind Header Debug: PagefindUI initialized successfully!");
     } catch (error) {
@@ -15,6 +15,18 @@
     });
   }
 
+  // Each spec version has its own Pagefind shard (pagefind/<version>/), the
+  // rest of the site lives in the root shard (pagefind/). A spec page only
+  // searches its own version; other pages search the site plus the latest
+  // version. The /search/ page merges every shard.
+  function searchScope() {
+    const versions = window.__SPEC_VERSIONS__ || [];
+    const m = location.pathname.match(/\/swhid-specification\/(v\d+\.\d+(?:\.\d+)?|dev)(?:\/|$)/);
+    if (m) return { version: m[1], shards: [`${m[1]}/`] };
+    const latest = versions[0];
+    return { version: null, shards: latest ? ["", `${latest}/`] : [""] };
+  }
+
   function ready(fn) {
     if (document.readyState === "loading") {
       document.addEventListener("DOMContentLoaded", fn, { once: true });
@@ -62,13 +74,22 @@
 
     // Initialize Pagefind UI directly in the header.
     // It will render its own input + live results dropdown.
+    // Bundle paths are resolved by pagefind-ui.js itself, so make them absolute.
+    const scope = searchScope();
+    const bundle = (shard) => new URL(`${BASE}pagefind/${shard}`, location.href).href;
+    if (scope.version) host.dataset.pfScope = scope.version;
+
     /* global PagefindUI */
     const pagefind = new PagefindUI({
       element: "#pf-header-ui",
+      bundlePath: bundle(scope.shards[0]),
+      mergeIndex: scope.shards.slice(1).map((shard) => ({ bundlePath: bundle(shard) })),
       showSubResults: true,
       showImages: false,
       showFilters: ["section", "spec_version", "tag"],
-      translations: { placeholder: "Search SWHID.org" },
+      translations: {
+        placeholder: scope.version ? `Search SWHID ${scope.version}` : "Search SWHID.org",
+      },
     });
 
     // --- helpers ---
@@ -0,0 +1,116 @@
+#!/usr/bin/env node
+// Build the Pagefind search index as one shard per specification version
+// plus one shard for the rest of the site.
+//
+//   site/pagefind/            -> everything outside /swhid-specification/<version>/
+//   site/pagefind/<version>/  -> pages of a single spec version (v1.0 ... dev)
+//
+// The header search only loads the shard of the page's version, so a query
+// no longer downloads fragments for every version of the specification.
+// Run after `mkdocs build` (see `make build`).
+import { promises as fs } from "node:fs";
+import path from "node:path";
+import * as pagefind from "pagefind";
+
+const SITE = process.env.SITE_DIR || "site";
+const OUTPUT = path.join(SITE, "pagefind");
+const SPEC_DIR = "swhid-specification";
+const VERSION_RE = /^(v\d+\.\d+(?:\.\d+)?|dev)$/;
+
+const INDEX_OPTIONS = {
+  forceLanguage: "en",
+  excludeSelectors: [".md-header", ".md-tabs", ".md-footer", ".swhid-banner"],
+};
+
+async function discoverVersions() {
+  let entries;
+  try {
+    entries = await fs.readdir(path.join(SITE, SPEC_DIR), { withFileTypes: true });
+  } catch {
+    return [];
+  }
+  // "latest" is a redirect alias, not a version of its own
+  return entries
+    .filter((e) => e.isDirectory() && VERSION_RE.test(e.name))
+    .map((e) => e.name)
+    .sort();
+}
+
+async function* walkHtml(dir, rel = "") {
+  for (const entry of await fs.readdir(dir, { withFileTypes: true })) {
+    const relPath = rel ? `${rel}/${entry.name}` : entry.name;
+    if (entry.isDirectory()) {
+      yield* walkHtml(path.join(dir, entry.name), relPath);
+    } else if (entry.name.endsWith(".html")) {
+      yield relPath;
+    }
+  }
+}
+
+function check(result, what) {
+  if (result.errors && result.errors.length) {
+    throw new Error(`${what}: ${result.errors.join("; ")}`);
+  }
+  return result;
+}
+
+async function buildSiteShard(versions) {
+  const { index } = check(await pagefind.createIndex(INDEX_OPTIONS), "createIndex");
+
+  let pages = 0;
+  for await (const rel of walkHtml(SITE)) {
+    if (rel.startsWith("pagefind/")) continue;
+    const [top, version] = rel.split("/");
+    if (top === SPEC_DIR && versions.includes(version)) continue;
+    const content = await fs.readFile(path.join(SITE, rel), "utf8");
+    check(await index.addHTMLFile({ sourcePath: rel, content }), `add ${rel}`);
+    pages += 1;
+  }
+
+  check(await index.writeFiles({ outputPath: OUTPUT }), "write site shard");
+  await index.deleteIndex();
+  console.log(`🔎 site: ${pages} pages -> ${OUTPUT}/`);
+}
+
+async function buildVersionShard(version) {
+  const outputPath = path.join(OUTPUT, version);
+  const { index } = check(await pagefind.createIndex(INDEX_OPTIONS), "createIndex");
+
+  // Index from the site root so result URLs keep their /swhid-specification/<v>/ prefix
+  const { page_count } = check(
+    await index.addDirectory({ path: SITE, glob: `${SPEC_DIR}/${version}/**/*.{html}` }),
+    `add ${version}`,
+  );
+
+  check(await index.writeFiles({ outputPath }), `write ${version} shard`);
+  await index.deleteIndex();
+  console.log(`🔎 ${version}: ${page_count} pages -> ${outputPath}/`);
+}
+
+async function main() {
+  // Drop stale shards (e.g. a version that no longer exists)
+  await fs.rm(OUTPUT, { recursive: true, force: true });
+
+  const versions = await discoverVersions();
+  console.log(`→ Search shards: site${versions.map((v) => `, ${v}`).join("")}`);
+
+  // The site shard is written first: it owns the pagefind/ root, version
+  // shards are nested below it.
+  await buildSiteShard(versions);
+  for (const version of versions) {
+    await buildVersionShard(version);
+  }
+
+  // Manifest for pages that merge every shard (e.g. /search/)
+  await fs.writeFile(
+    path.join(OUTPUT, "shards.json"),
+    JSON.stringify({ versions }, null, 2) + "\n",
+  );
+}
+
+main()
+  .catch((e) => {
+    console.error(`❌ Search index build failed: ${e.message}`);
+    process.exitCode = 1;
+  })
+  .finally(() => pagefind.close());